@@ -3,11 +3,12 @@
 from __future__ import annotations
 
 import asyncio
+from collections import deque
 from collections.abc import AsyncIterable, Callable
 import io
 import logging
 import socket
-from typing import cast
+from typing import ClassVar, cast
 import wave
 
 from aioesphomeapi import (
@@ -42,6 +43,8 @@ _LOGGER = logging.getLogger(__name__)
 
 UDP_PORT = 0  # Set to 0 to let the OS pick a free random port
 UDP_MAX_PACKET_SIZE = 1024
+# Drop the oldest audio instead of buffering without bound if the pipeline lags
+UDP_MAX_QUEUED_PACKETS = 1024
 
 _VOICE_ASSISTANT_EVENT_TYPES: EsphomeEnumMapper[
     VoiceAssistantEventType, PipelineEventType
@@ -63,6 +66,9 @@ _VOICE_ASSISTANT_EVENT_TYPES: EsphomeEnumMapper[
     }
 )
 
+# The event type and data sent to the device for a pipeline event
+_EventResult = tuple[VoiceAssistantEventType, dict[str, str] | None]
+
 
 class VoiceAssistantUDPServer(asyncio.DatagramProtocol):
     """Receive UDP packets and forward them to the voice assistant."""
@@ -87,7 +93,9 @@ class VoiceAssistantUDPServer(asyncio.DatagramProtocol):
         self.entry_data = entry_data
         self.device_info = entry_data.device_info
 
-        self.queue: asyncio.Queue[bytes] = asyncio.Queue()
+        self.queue: deque[bytes] = deque(maxlen=UDP_MAX_QUEUED_PACKETS)
+        self._queue_event = asyncio.Event()
+        self._queue_overflow_logged = False
         self.handle_event = handle_event
         self.handle_finished = handle_finished
         self._tts_done = asyncio.Event()
@@ -134,7 +142,15 @@ class VoiceAssistantUDPServer(asyncio.DatagramProtocol):
             return
         if self.remote_addr is None:
             self.remote_addr = addr
-        self.queue.put_nowait(data)
+        if (len(self.queue) == self.queue.maxlen) and (
+            not self._queue_overflow_logged
+        ):
+            _LOGGER.warning(
+                "ESPHome Voice Assistant UDP queue is full, dropping oldest audio"
+            )
+            self._queue_overflow_logged = True
+        self.queue.append(data)
+        self._queue_event.set()
 
     def error_received(self, exc: Exception) -> None:
         """Handle when a send or receive operation raises an OSError.
@@ -147,7 +163,8 @@ class VoiceAssistantUDPServer(asyncio.DatagramProtocol):
     @callback
     def stop(self) -> None:
         """Stop the receiver."""
-        self.queue.put_nowait(b"")
+        self.queue.append(b"")
+        self._queue_event.set()
         self.close()
 
     def close(self) -> None:
@@ -160,12 +177,102 @@ class VoiceAssistantUDPServer(asyncio.DatagramProtocol):
 
     async def _iterate_packets(self) -> AsyncIterable[bytes]:
         """Iterate over incoming packets."""
-        while data := await self.queue.get():
-            if not self.is_running:
-                break
+        while True:
+            # Only wait when there is nothing queued, a previous iterator may
+            # have stopped before draining the queue.
+            while not self.queue:
+                await self._queue_event.wait()
+                self._queue_event.clear()
+
+            data = self.queue.popleft()
+            if (not data) or (not self.is_running):
+                return
 
             yield data
 
+    def _handle_stt_start(self, event: PipelineEvent) -> _EventResult:
+        """Handle the STT start event."""
+        self.entry_data.async_set_assist_pipeline_state(True)
+        return VoiceAssistantEventType.VOICE_ASSISTANT_STT_START, None
+
+    def _handle_stt_end(self, event: PipelineEvent) -> _EventResult:
+        """Handle the STT end event."""
+        assert event.data is not None
+        return VoiceAssistantEventType.VOICE_ASSISTANT_STT_END, {
+            "text": event.data["stt_output"]["text"]
+        }
+
+    def _handle_intent_end(self, event: PipelineEvent) -> _EventResult:
+        """Handle the intent end event."""
+        assert event.data is not None
+        return VoiceAssistantEventType.VOICE_ASSISTANT_INTENT_END, {
+            "conversation_id": event.data["intent_output"]["conversation_id"] or "",
+        }
+
+    def _handle_tts_start(self, event: PipelineEvent) -> _EventResult:
+        """Handle the TTS start event."""
+        assert event.data is not None
+        return VoiceAssistantEventType.VOICE_ASSISTANT_TTS_START, {
+            "text": event.data["tts_input"]
+        }
+
+    def _handle_tts_end(self, event: PipelineEvent) -> _EventResult:
+        """Handle the TTS end event."""
+        assert event.data is not None
+        tts_output = event.data["tts_output"]
+        if not tts_output:
+            # Empty TTS response
+            self._tts_done.set()
+            return VoiceAssistantEventType.VOICE_ASSISTANT_TTS_END, {}
+
+        path = tts_output["url"]
+        url = async_process_play_media_url(self.hass, path)
+
+        if self.device_info.voice_assistant_version >= 2:
+            media_id = tts_output["media_id"]
+            self._tts_task = self.hass.async_create_background_task(
+                self._send_tts(media_id), "esphome_voice_assistant_tts"
+            )
+        else:
+            self._tts_done.set()
+
+        return VoiceAssistantEventType.VOICE_ASSISTANT_TTS_END, {"url": url}
+
+    def _handle_wake_word_end(self, event: PipelineEvent) -> _EventResult:
+        """Handle the wake word end event."""
+        assert event.data is not None
+        if not event.data["wake_word_output"]:
+            return VoiceAssistantEventType.VOICE_ASSISTANT_ERROR, {
+                "code": "no_wake_word",
+                "message": "No wake word detected",
+            }
+        return VoiceAssistantEventType.VOICE_ASSISTANT_WAKE_WORD_END, None
+
+    def _handle_error(self, event: PipelineEvent) -> _EventResult:
+        """Handle the error event."""
+        assert event.data is not None
+        return VoiceAssistantEventType.VOICE_ASSISTANT_ERROR, {
+            "code": event.data["code"],
+            "message": event.data["message"],
+        }
+
+    # Every handler takes the event, even if unused, so they can all be
+    # dispatched the same way from _event_callback.
+    _EVENT_HANDLERS: ClassVar[
+        dict[
+            VoiceAssistantEventType,
+            Callable[[VoiceAssistantUDPServer, PipelineEvent], _EventResult],
+        ]
+    ] = {
+        VoiceAssistantEventType.VOICE_ASSISTANT_STT_START: _handle_stt_start,
+        VoiceAssistantEventType.VOICE_ASSISTANT_STT_END: _handle_stt_end,
+        VoiceAssistantEventType.VOICE_ASSISTANT_INTENT_END: _handle_intent_end,
+        VoiceAssistantEventType.VOICE_ASSISTANT_TTS_START: _handle_tts_start,
+        VoiceAssistantEventType.VOICE_ASSISTANT_TTS_END: _handle_tts_end,
+        VoiceAssistantEventType.VOICE_ASSISTANT_WAKE_WORD_END: _handle_wake_word_end,
+        VoiceAssistantEventType.VOICE_ASSISTANT_ERROR: _handle_error,
+    }
+
     def _event_callback(self, event: PipelineEvent) -> None:
         """Handle pipeline events."""
 
@@ -175,59 +282,12 @@ class VoiceAssistantUDPServer(asyncio.DatagramProtocol):
             _LOGGER.debug("Received unknown pipeline event type: %s", event.type)
             return
 
-        data_to_send = None
-        error = False
-        if event_type == VoiceAssistantEventType.VOICE_ASSISTANT_STT_START:
-            self.entry_data.async_set_assist_pipeline_state(True)
-        elif event_type == VoiceAssistantEventType.VOICE_ASSISTANT_STT_END:
-            assert event.data is not None
-            data_to_send = {"text": event.data["stt_output"]["text"]}
-        elif event_type == VoiceAssistantEventType.VOICE_ASSISTANT_INTENT_END:
-            assert event.data is not None
-            data_to_send = {
-                "conversation_id": event.data["intent_output"]["conversation_id"] or "",
-            }
-        elif event_type == VoiceAssistantEventType.VOICE_ASSISTANT_TTS_START:
-            assert event.data is not None
-            data_to_send = {"text": event.data["tts_input"]}
-        elif event_type == VoiceAssistantEventType.VOICE_ASSISTANT_TTS_END:
-            assert event.data is not None
-            tts_output = event.data["tts_output"]
-            if tts_output:
-                path = tts_output["url"]
-                url = async_process_play_media_url(self.hass, path)
-                data_to_send = {"url": url}
-
-                if self.device_info.voice_assistant_version >= 2:
-                    media_id = tts_output["media_id"]
-                    self._tts_task = self.hass.async_create_background_task(
-                        self._send_tts(media_id), "esphome_voice_assistant_tts"
-                    )
-                else:
-                    self._tts_done.set()
-            else:
-                # Empty TTS response
-                data_to_send = {}
-                self._tts_done.set()
-        elif event_type == VoiceAssistantEventType.VOICE_ASSISTANT_WAKE_WORD_END:
-            assert event.data is not None
-            if not event.data["wake_word_output"]:
-                event_type = VoiceAssistantEventType.VOICE_ASSISTANT_ERROR
-                data_to_send = {
-                    "code": "no_wake_word",
-                    "message": "No wake word detected",
-                }
-                error = True
-        elif event_type == VoiceAssistantEventType.VOICE_ASSISTANT_ERROR:
-            assert event.data is not None
-            data_to_send = {
-                "code": event.data["code"],
-                "message": event.data["message"],
-            }
-            error = True
+        data_to_send: dict[str, str] | None = None
+        if (handler := self._EVENT_HANDLERS.get(event_type)) is not None:
+            event_type, data_to_send = handler(self, event)
 
         self.handle_event(event_type, data_to_send)
-        if error:
+        if event_type == VoiceAssistantEventType.VOICE_ASSISTANT_ERROR:
             self._tts_done.set()
             self.handle_finished()
 
@@ -349,12 +409,14 @@ class VoiceAssistantUDPServer(asyncio.DatagramProtocol):
             _LOGGER.debug("Sending %d bytes of audio", audio_bytes_size)
 
             bytes_per_sample = stt.AudioBitRates.BITRATE_16 // 8
+            # Slicing a memoryview doesn't copy the audio for each chunk
+            audio_view = memoryview(audio_bytes)
             sample_offset = 0
             samples_left = audio_bytes_size // bytes_per_sample
 
             while (samples_left > 0) and self.is_running:
                 bytes_offset = sample_offset * bytes_per_sample
-                chunk: bytes = audio_bytes[bytes_offset : bytes_offset + 1024]
+                chunk = audio_view[bytes_offset : bytes_offset + 1024]
                 samples_in_chunk = len(chunk) // bytes_per_sample
                 samples_left -= samples_in_chunk
 
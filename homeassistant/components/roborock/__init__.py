@@ -129,14 +129,22 @@ async def setup_device(
     # Verify we can communicate locally - if we can't, switch to cloud api
     await coordinator.verify_api()
     coordinator.api.is_available = True
+
+    async def _get_maps_logging_errors() -> None:
+        """Get the maps, setup can continue without them."""
+        try:
+            await coordinator.get_maps()
+        except RoborockException as err:
+            _LOGGER.warning("Failed to get map data")
+            _LOGGER.debug(err)
+
+    # The maps do not depend on the first refresh, so fetch them at the same time
     try:
-        await coordinator.get_maps()
-    except RoborockException as err:
-        _LOGGER.warning("Failed to get map data")
-        _LOGGER.debug(err)
-    try:
-        await coordinator.async_config_entry_first_refresh()
-    except ConfigEntryNotReady as ex:
+        async with asyncio.TaskGroup() as tg:
+            tg.create_task(_get_maps_logging_errors())
+            tg.create_task(coordinator.async_config_entry_first_refresh())
+    except* ConfigEntryNotReady as ex_group:
+        ex = ex_group.exceptions[0]
         await coordinator.release()
         if isinstance(coordinator.api, RoborockMqttClient):
             _LOGGER.warning(
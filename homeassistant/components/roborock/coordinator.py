@@ -3,7 +3,7 @@
 from __future__ import annotations
 
 import asyncio
-from datetime import timedelta
+from datetime import datetime, timedelta
 import logging
 
 from roborock import HomeDataRoom
@@ -18,11 +18,14 @@ from homeassistant.core import HomeAssistant
 from homeassistant.helpers import device_registry as dr
 from homeassistant.helpers.device_registry import DeviceInfo
 from homeassistant.helpers.update_coordinator import DataUpdateCoordinator, UpdateFailed
+from homeassistant.util import dt as dt_util
 
 from .const import DOMAIN
 from .models import RoborockHassDeviceInfo, RoborockMapInfo
 
 SCAN_INTERVAL = timedelta(seconds=30)
+# Refetch the room mapping periodically in case rooms were changed in the app
+ROOM_REFRESH_INTERVAL = timedelta(minutes=5)
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -51,25 +54,29 @@ class RoborockDataUpdateCoordinator(DataUpdateCoordinator[DeviceProp]):
         self.api: RoborockLocalClient | RoborockMqttClient = RoborockLocalClient(
             device_data
         )
+        self._api_is_local = True
         self.cloud_api = cloud_api
         self.device_info = DeviceInfo(
-            name=self.roborock_device_info.device.name,
-            identifiers={(DOMAIN, self.roborock_device_info.device.duid)},
+            name=device.name,
+            identifiers={(DOMAIN, device.duid)},
             manufacturer="Roborock",
-            model=self.roborock_device_info.product.model,
-            sw_version=self.roborock_device_info.device.fv,
+            model=product_info.model,
+            sw_version=device.fv,
         )
-        self.current_map: int | None = None
-
-        if mac := self.roborock_device_info.network_info.mac:
+        if mac := device_networking.mac:
             self.device_info[ATTR_CONNECTIONS] = {(dr.CONNECTION_NETWORK_MAC, mac)}
+        self.current_map: int | None = None
         # Maps from map flag to map name
         self.maps: dict[int, RoborockMapInfo] = {}
         self._home_data_rooms = {str(room.id): room.name for room in home_data_rooms}
+        # The map flag and time the rooms were last fetched, so we only refetch
+        # when the map changes or the mapping is stale
+        self._rooms_fetched_for_map: int | None = None
+        self._rooms_fetched_at: datetime | None = None
 
     async def verify_api(self) -> None:
         """Verify that the api is reachable. If it is not, switch clients."""
-        if isinstance(self.api, RoborockLocalClient):
+        if self._api_is_local:
             try:
                 await self.api.ping()
             except RoborockException:
@@ -79,6 +86,7 @@ class RoborockDataUpdateCoordinator(DataUpdateCoordinator[DeviceProp]):
                 )
                 # We use the cloud api if the local api fails to connect.
                 self.api = self.cloud_api
+                self._api_is_local = False
                 # Right now this should never be called if the cloud api is the primary api,
                 # but in the future if it is, a new else should be added.
 
@@ -89,41 +97,46 @@ class RoborockDataUpdateCoordinator(DataUpdateCoordinator[DeviceProp]):
 
     async def _update_device_prop(self) -> None:
         """Update device properties."""
-        device_prop = await self.api.get_prop()
-        if device_prop:
-            if self.roborock_device_info.props:
-                self.roborock_device_info.props.update(device_prop)
-            else:
-                self.roborock_device_info.props = device_prop
+        if device_prop := await self.api.get_prop():
+            # props is always initialized in __init__, so it can be updated in place.
+            self.roborock_device_info.props.update(device_prop)
 
     async def _async_update_data(self) -> DeviceProp:
         """Update data via library."""
         try:
-            await asyncio.gather(*(self._update_device_prop(), self.get_rooms()))
-            self._set_current_map()
-        except RoborockException as ex:
+            async with asyncio.TaskGroup() as tg:
+                tg.create_task(self._update_device_prop())
+                tg.create_task(self.get_rooms())
+        except* RoborockException as ex_group:
+            ex = ex_group.exceptions[0]
             raise UpdateFailed(ex) from ex
+        self._set_current_map()
         return self.roborock_device_info.props
 
     def _set_current_map(self) -> None:
-        if (
-            self.roborock_device_info.props.status is not None
-            and self.roborock_device_info.props.status.map_status is not None
-        ):
-            # The map status represents the map flag as flag * 4 + 3 -
-            # so we have to invert that in order to get the map flag that we can use to set the current map.
-            self.current_map = (
-                self.roborock_device_info.props.status.map_status - 3
-            ) // 4
+        if (status := self.roborock_device_info.props.status) is None:
+            return
+        if (map_status := status.map_status) is None:
+            return
+        # The map status represents the map flag as flag * 4 + 3 -
+        # so we have to invert that in order to get the map flag that we can use to set the current map.
+        current_map = (map_status - 3) // 4
+        if current_map != self.current_map:
+            self._rooms_fetched_for_map = None
+        self.current_map = current_map
 
     async def get_maps(self) -> None:
         """Add a map to the coordinators mapping."""
         maps = await self.api.get_multi_maps_list()
         if maps and maps.map_info:
-            for roborock_map in maps.map_info:
-                self.maps[roborock_map.mapFlag] = RoborockMapInfo(
-                    flag=roborock_map.mapFlag, name=roborock_map.name, rooms={}
-                )
+            self.maps.update(
+                {
+                    roborock_map.mapFlag: RoborockMapInfo(
+                        flag=roborock_map.mapFlag, name=roborock_map.name, rooms={}
+                    )
+                    for roborock_map in maps.map_info
+                }
+            )
 
     async def get_rooms(self) -> None:
         """Get all of the rooms for the current map."""
@@ -131,9 +144,19 @@ class RoborockDataUpdateCoordinator(DataUpdateCoordinator[DeviceProp]):
         # So it is important this is only called when you have the map you care
         # about selected.
         if self.current_map in self.maps:
+            if (
+                self.current_map == self._rooms_fetched_for_map
+                and self.maps[self.current_map].rooms
+                and self._rooms_fetched_at is not None
+                and dt_util.utcnow() - self._rooms_fetched_at < ROOM_REFRESH_INTERVAL
+            ):
+                return
             iot_rooms = await self.api.get_room_mapping()
             if iot_rooms is not None:
-                for room in iot_rooms:
-                    self.maps[self.current_map].rooms[room.segment_id] = (
-                        self._home_data_rooms.get(room.iot_id, "Unknown")
-                    )
+                lookup = self._home_data_rooms
+                self.maps[self.current_map].rooms = {
+                    room.segment_id: lookup.get(room.iot_id, "Unknown")
+                    for room in iot_rooms
+                }
+                self._rooms_fetched_for_map = self.current_map
+                self._rooms_fetched_at = dt_util.utcnow()
@@ -1,12 +1,11 @@
 """Test ESPHome voice assistant server."""
 
 import asyncio
-import io
+from collections.abc import Callable
 import socket
 from unittest.mock import Mock, patch
-import wave
 
-from aioesphomeapi import VoiceAssistantEventType
+from aioesphomeapi import DeviceInfo, VoiceAssistantEventType
 import pytest
 
 from homeassistant.components.assist_pipeline import (
@@ -19,6 +18,7 @@ from homeassistant.components.assist_pipeline.error import (
     WakeWordDetectionError,
 )
 from homeassistant.components.esphome import DomainData
+from homeassistant.components.esphome.entry_data import RuntimeEntryData
 from homeassistant.components.esphome.voice_assistant import VoiceAssistantUDPServer
 from homeassistant.core import HomeAssistant
 
@@ -30,6 +30,29 @@ _TEST_MEDIA_ID = "12345"
 _ONE_SECOND = 16000 * 2  # 16Khz 16-bit
 
 
+def _build_wav(sample_rate: int) -> bytes:
+    """Return one second of empty mono 16-bit WAV audio."""
+    return (
+        b"RIFF"
+        + (36 + _ONE_SECOND).to_bytes(4, "little")
+        + b"WAVEfmt "
+        + (16).to_bytes(4, "little")  # fmt chunk size
+        + (1).to_bytes(2, "little")  # PCM
+        + (1).to_bytes(2, "little")  # mono
+        + sample_rate.to_bytes(4, "little")
+        + (sample_rate * 2).to_bytes(4, "little")  # byte rate
+        + (2).to_bytes(2, "little")  # block align
+        + (16).to_bytes(2, "little")  # bits per sample
+        + b"data"
+        + _ONE_SECOND.to_bytes(4, "little")
+        + bytes(_ONE_SECOND)
+    )
+
+
+_TEST_WAV = _build_wav(16000)
+_TEST_WAV_WRONG_SAMPLE_RATE = _build_wav(22050)
+
+
 @pytest.fixture
 def voice_assistant_udp_server(
     hass: HomeAssistant,
@@ -39,17 +62,32 @@ def voice_assistant_udp_server(
     def _voice_assistant_udp_server(entry):
         entry_data = DomainData.get(hass).get_entry_data(entry)
 
-        server: VoiceAssistantUDPServer = None
+        server = VoiceAssistantUDPServer(hass, entry_data, Mock(), Mock())
+        server.handle_finished = server.close
+        return server
 
-        def handle_finished():
-            nonlocal server
-            assert server is not None
-            server.close()
+    return _voice_assistant_udp_server
 
-        server = VoiceAssistantUDPServer(hass, entry_data, Mock(), handle_finished)
-        return server  # noqa: RET504
 
-    return _voice_assistant_udp_server
+@pytest.fixture
+def mock_voice_assistant_udp_server(
+    hass: HomeAssistant,
+) -> Callable[[int], VoiceAssistantUDPServer]:
+    """Return a UDP server factory that does not set up an ESPHome entry.
+
+    Useful for tests that only exercise the pipeline event callback.
+    """
+
+    def _mock_voice_assistant_udp_server(
+        voice_assistant_version: int,
+    ) -> VoiceAssistantUDPServer:
+        entry_data = Mock(spec=RuntimeEntryData)
+        entry_data.device_info = DeviceInfo(
+            voice_assistant_version=voice_assistant_version
+        )
+        return VoiceAssistantUDPServer(hass, entry_data, Mock(), Mock())
+
+    return _mock_voice_assistant_udp_server
 
 
 @pytest.fixture
@@ -73,14 +111,7 @@ def voice_assistant_udp_server_v2(
 @pytest.fixture
 def test_wav() -> bytes:
     """Return one second of empty WAV audio."""
-    with io.BytesIO() as wav_io:
-        with wave.open(wav_io, "wb") as wav_file:
-            wav_file.setframerate(16000)
-            wav_file.setsampwidth(2)
-            wav_file.setnchannels(1)
-            wav_file.writeframes(bytes(_ONE_SECOND))
-
-        return wav_io.getvalue()
+    return _TEST_WAV
 
 
 async def test_pipeline_events(
@@ -175,15 +206,14 @@ async def test_udp_server(
 
         sock = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
 
-        assert voice_assistant_udp_server_v1.queue.qsize() == 0
+        assert not voice_assistant_udp_server_v1.queue
         sock.sendto(b"test", ("127.0.0.1", port))
 
-        # Give the socket some time to send/receive the data
+        # Wait for the data to be received
         async with asyncio.timeout(1):
-            while voice_assistant_udp_server_v1.queue.qsize() == 0:
-                await asyncio.sleep(0.1)
+            await voice_assistant_udp_server_v1._queue_event.wait()
 
-        assert voice_assistant_udp_server_v1.queue.qsize() == 1
+        assert voice_assistant_udp_server_v1.queue.popleft() == b"test"
 
         voice_assistant_udp_server_v1.stop()
         voice_assistant_udp_server_v1.close()
@@ -199,27 +229,27 @@ async def test_udp_server_queue(
 
     voice_assistant_udp_server_v1.started = True
 
-    assert voice_assistant_udp_server_v1.queue.qsize() == 0
+    assert not voice_assistant_udp_server_v1.queue
 
     voice_assistant_udp_server_v1.datagram_received(bytes(1024), ("localhost", 0))
-    assert voice_assistant_udp_server_v1.queue.qsize() == 1
+    assert len(voice_assistant_udp_server_v1.queue) == 1
 
     voice_assistant_udp_server_v1.datagram_received(bytes(1024), ("localhost", 0))
-    assert voice_assistant_udp_server_v1.queue.qsize() == 2
+    assert len(voice_assistant_udp_server_v1.queue) == 2
 
     async for data in voice_assistant_udp_server_v1._iterate_packets():
         assert data == bytes(1024)
         break
-    assert voice_assistant_udp_server_v1.queue.qsize() == 1  # One message removed
+    assert len(voice_assistant_udp_server_v1.queue) == 1  # One message removed
 
     voice_assistant_udp_server_v1.stop()
     assert (
-        voice_assistant_udp_server_v1.queue.qsize() == 2
+        len(voice_assistant_udp_server_v1.queue) == 2
     )  # An empty message added by stop
 
     voice_assistant_udp_server_v1.datagram_received(bytes(1024), ("localhost", 0))
     assert (
-        voice_assistant_udp_server_v1.queue.qsize() == 2
+        len(voice_assistant_udp_server_v1.queue) == 2
     )  # No new messages added after stop
 
     voice_assistant_udp_server_v1.close()
@@ -233,6 +263,49 @@ async def test_udp_server_queue(
     assert not has_data, "Server was stopped"
 
 
+async def test_udp_server_queue_new_iterator(
+    hass: HomeAssistant,
+    voice_assistant_udp_server_v1: VoiceAssistantUDPServer,
+) -> None:
+    """Test a new iterator yields data left queued by a previous iterator."""
+    voice_assistant_udp_server_v1.started = True
+
+    voice_assistant_udp_server_v1.datagram_received(b"a", ("localhost", 0))
+    voice_assistant_udp_server_v1.datagram_received(b"b", ("localhost", 0))
+
+    async for data in voice_assistant_udp_server_v1._iterate_packets():
+        assert data == b"a"
+        break
+
+    async with asyncio.timeout(1):
+        async for data in voice_assistant_udp_server_v1._iterate_packets():
+            assert data == b"b"
+            break
+
+    assert not voice_assistant_udp_server_v1.queue
+
+
+async def test_udp_server_queue_bounded(
+    hass: HomeAssistant,
+    voice_assistant_udp_server,
+    mock_voice_assistant_v1_entry,
+    caplog: pytest.LogCaptureFixture,
+) -> None:
+    """Test the UDP server drops and logs the oldest data when the queue is full."""
+    with patch(
+        "homeassistant.components.esphome.voice_assistant.UDP_MAX_QUEUED_PACKETS", 2
+    ):
+        server = voice_assistant_udp_server(entry=mock_voice_assistant_v1_entry)
+
+    server.started = True
+    for i in range(4):
+        server.datagram_received(bytes([i]), ("localhost", 0))
+
+    assert list(server.queue) == [bytes([2]), bytes([3])]
+    # Dropping audio is only logged once per run
+    assert caplog.text.count("UDP queue is full") == 1
+
+
 async def test_error_calls_handle_finished(
     hass: HomeAssistant,
     voice_assistant_udp_server_v1: VoiceAssistantUDPServer,
@@ -288,9 +361,10 @@ async def test_udp_server_after_stopped(
 
 async def test_unknown_event_type(
     hass: HomeAssistant,
-    voice_assistant_udp_server_v1: VoiceAssistantUDPServer,
+    mock_voice_assistant_udp_server: Callable[[int], VoiceAssistantUDPServer],
 ) -> None:
     """Test the UDP server does not call handle_event for unknown events."""
+    voice_assistant_udp_server_v1 = mock_voice_assistant_udp_server(1)
     voice_assistant_udp_server_v1._event_callback(
         PipelineEvent(
             type="unknown-event",
@@ -303,9 +377,10 @@ async def test_unknown_event_type(
 
 async def test_error_event_type(
     hass: HomeAssistant,
-    voice_assistant_udp_server_v1: VoiceAssistantUDPServer,
+    mock_voice_assistant_udp_server: Callable[[int], VoiceAssistantUDPServer],
 ) -> None:
     """Test the UDP server calls event handler with error."""
+    voice_assistant_udp_server_v1 = mock_voice_assistant_udp_server(1)
     voice_assistant_udp_server_v1._event_callback(
         PipelineEvent(
             type=PipelineEventType.ERROR,
@@ -321,9 +396,10 @@ async def test_error_event_type(
 
 async def test_send_tts_not_called(
     hass: HomeAssistant,
-    voice_assistant_udp_server_v1: VoiceAssistantUDPServer,
+    mock_voice_assistant_udp_server: Callable[[int], VoiceAssistantUDPServer],
 ) -> None:
     """Test the UDP server with a v1 device does not call _send_tts."""
+    voice_assistant_udp_server_v1 = mock_voice_assistant_udp_server(1)
     with patch(
         "homeassistant.components.esphome.voice_assistant.VoiceAssistantUDPServer._send_tts"
     ) as mock_send_tts:
@@ -341,9 +417,10 @@ async def test_send_tts_not_called(
 
 async def test_send_tts_called(
     hass: HomeAssistant,
-    voice_assistant_udp_server_v2: VoiceAssistantUDPServer,
+    mock_voice_assistant_udp_server: Callable[[int], VoiceAssistantUDPServer],
 ) -> None:
     """Test the UDP server with a v2 device calls _send_tts."""
+    voice_assistant_udp_server_v2 = mock_voice_assistant_udp_server(2)
     with patch(
         "homeassistant.components.esphome.voice_assistant.VoiceAssistantUDPServer._send_tts"
     ) as mock_send_tts:
@@ -361,10 +438,11 @@ async def test_send_tts_called(
 
 async def test_send_tts_not_called_when_empty(
     hass: HomeAssistant,
-    voice_assistant_udp_server_v1: VoiceAssistantUDPServer,
-    voice_assistant_udp_server_v2: VoiceAssistantUDPServer,
+    mock_voice_assistant_udp_server: Callable[[int], VoiceAssistantUDPServer],
 ) -> None:
     """Test the UDP server with a v1/v2 device doesn't call _send_tts when the output is empty."""
+    voice_assistant_udp_server_v1 = mock_voice_assistant_udp_server(1)
+    voice_assistant_udp_server_v2 = mock_voice_assistant_udp_server(2)
     with patch(
         "homeassistant.components.esphome.voice_assistant.VoiceAssistantUDPServer._send_tts"
     ) as mock_send_tts:
@@ -418,18 +496,10 @@ async def test_send_tts_wrong_sample_rate(
     voice_assistant_udp_server_v2: VoiceAssistantUDPServer,
 ) -> None:
     """Test the UDP server calls sendto to transmit audio data to device."""
-    with io.BytesIO() as wav_io:
-        with wave.open(wav_io, "wb") as wav_file:
-            wav_file.setframerate(22050)
-            wav_file.setsampwidth(2)
-            wav_file.setnchannels(1)
-            wav_file.writeframes(bytes(_ONE_SECOND))
-
-        wav_bytes = wav_io.getvalue()
     with (
         patch(
             "homeassistant.components.esphome.voice_assistant.tts.async_get_media_source_audio",
-            return_value=("wav", wav_bytes),
+            return_value=("wav", _TEST_WAV_WRONG_SAMPLE_RATE),
         ),
         pytest.raises(ValueError),
     ):
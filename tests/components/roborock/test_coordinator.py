@@ -0,0 +1,96 @@
+"""Test for Roborock coordinator."""
+
+import copy
+from unittest.mock import patch
+
+from roborock import RoomMapping
+
+from homeassistant.components.roborock.const import DOMAIN
+from homeassistant.components.roborock.coordinator import (
+    ROOM_REFRESH_INTERVAL,
+    RoborockDataUpdateCoordinator,
+)
+from homeassistant.core import HomeAssistant
+from homeassistant.util import dt as dt_util
+
+from .mock_data import PROP
+
+from tests.common import MockConfigEntry
+
+ROOM_MAPPING = [
+    RoomMapping(16, "2362048"),
+    RoomMapping(17, "2362044"),
+    RoomMapping(18, "2362041"),
+]
+
+
+def _get_coordinator(
+    hass: HomeAssistant, entry: MockConfigEntry
+) -> RoborockDataUpdateCoordinator:
+    return hass.data[DOMAIN][entry.entry_id]["abc123"]
+
+
+async def test_rooms_cached_for_unchanged_map(
+    hass: HomeAssistant, setup_entry: MockConfigEntry
+) -> None:
+    """Test that the room mapping is only fetched once while the map is unchanged."""
+    coordinator = _get_coordinator(hass, setup_entry)
+    with patch(
+        "homeassistant.components.roborock.coordinator.RoborockLocalClient.get_room_mapping",
+        return_value=ROOM_MAPPING,
+    ) as mock_get_room_mapping:
+        await coordinator.async_refresh()
+        await coordinator.async_refresh()
+
+    assert mock_get_room_mapping.call_count == 1
+
+
+async def test_rooms_fetched_after_map_change(
+    hass: HomeAssistant, setup_entry: MockConfigEntry
+) -> None:
+    """Test that the room mapping is fetched again when the map changes."""
+    coordinator = _get_coordinator(hass, setup_entry)
+    with patch(
+        "homeassistant.components.roborock.coordinator.RoborockLocalClient.get_room_mapping",
+        return_value=ROOM_MAPPING,
+    ) as mock_get_room_mapping:
+        await coordinator.async_refresh()
+        assert mock_get_room_mapping.call_count == 1
+        assert coordinator.current_map == 0
+
+        # Copy the device prop so we don't override it
+        prop = copy.deepcopy(PROP)
+        prop.status.map_status = 7
+        with patch(
+            "homeassistant.components.roborock.coordinator.RoborockLocalClient.get_prop",
+            return_value=prop,
+        ):
+            # The rooms are fetched alongside the props, so the new map is only
+            # used for the room mapping on the following refresh.
+            await coordinator.async_refresh()
+            assert coordinator.current_map == 1
+            await coordinator.async_refresh()
+
+    assert mock_get_room_mapping.call_count == 2
+
+
+async def test_rooms_fetched_after_expiry(
+    hass: HomeAssistant, setup_entry: MockConfigEntry
+) -> None:
+    """Test that the room mapping is fetched again once it is stale."""
+    coordinator = _get_coordinator(hass, setup_entry)
+    with patch(
+        "homeassistant.components.roborock.coordinator.RoborockLocalClient.get_room_mapping",
+        return_value=ROOM_MAPPING,
+    ) as mock_get_room_mapping:
+        await coordinator.async_refresh()
+        assert mock_get_room_mapping.call_count == 1
+
+        now = dt_util.utcnow() + ROOM_REFRESH_INTERVAL
+        with patch(
+            "homeassistant.components.roborock.coordinator.dt_util.utcnow",
+            return_value=now,
+        ):
+            await coordinator.async_refresh()
+
+    assert mock_get_room_mapping.call_count == 2
@@ -9,6 +9,8 @@ from homeassistant.config_entries import ConfigEntryState
 from homeassistant.core import HomeAssistant
 from homeassistant.setup import async_setup_component
 
+from .mock_data import PROP
+
 from tests.common import MockConfigEntry
 
 
@@ -131,6 +133,51 @@ async def test_fails_maps_continue(
         assert len(hass.states.async_all("image")) == 0
 
 
+async def test_fails_maps_first_refresh_succeeds(
+    hass: HomeAssistant, mock_roborock_entry: MockConfigEntry, bypass_api_fixture
+) -> None:
+    """Test that a map failure alongside a successful first refresh still sets up."""
+    with (
+        patch(
+            "homeassistant.components.roborock.coordinator.RoborockLocalClient.get_multi_maps_list",
+            side_effect=RoborockException(),
+        ),
+        patch(
+            "homeassistant.components.roborock.coordinator.RoborockLocalClient.get_prop",
+            return_value=PROP,
+        ) as mock_get_prop,
+    ):
+        await async_setup_component(hass, DOMAIN, {})
+        assert mock_roborock_entry.state is ConfigEntryState.LOADED
+        assert mock_get_prop.called
+        coordinators = hass.data[DOMAIN][mock_roborock_entry.entry_id].values()
+        assert all(not coordinator.maps for coordinator in coordinators)
+        assert all(coordinator.data is not None for coordinator in coordinators)
+
+
+async def test_first_refresh_fails_releases_coordinator(
+    hass: HomeAssistant, mock_roborock_entry: MockConfigEntry, bypass_api_fixture
+) -> None:
+    """Test that the coordinator is released if the first refresh fails."""
+    with (
+        patch(
+            "homeassistant.components.roborock.coordinator.RoborockLocalClient.get_prop",
+            side_effect=RoborockException(),
+        ),
+        patch(
+            "homeassistant.components.roborock.coordinator.RoborockLocalClient.async_release"
+        ) as mock_local_release,
+        patch(
+            "homeassistant.components.roborock.coordinator.RoborockMqttClient.async_release"
+        ) as mock_cloud_release,
+    ):
+        await async_setup_component(hass, DOMAIN, {})
+        assert mock_roborock_entry.state is ConfigEntryState.SETUP_RETRY
+        # One local and one cloud client are released for each of the two devices
+        assert mock_local_release.call_count == 2
+        assert mock_cloud_release.call_count == 2
+
+
 async def test_reauth_started(
     hass: HomeAssistant, bypass_api_fixture, mock_roborock_entry: MockConfigEntry
 ) -> None: